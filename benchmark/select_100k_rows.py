@@ -13,38 +13,60 @@ import psutil
 import sqlalchemy as sa
 from rich.console import Console
 from rich.table import Table
+from sqlalchemy import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.ext.asyncio import AsyncSession as sa_AsyncSession
-from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from typing_extensions import assert_never
 
 from naked_sqla.om.asession import AsyncSession, AsyncSessionFactory
 
 DB_URL = "sqlite+aiosqlite:///test.db"
-engine = create_async_engine(DB_URL, echo=False)
+# aiosqlite files get a NullPool by default, which reconnects (and reruns the pragmas) every run.
+# runs are sequential and use one connection at a time, so a single pooled connection is enough.
+engine = create_async_engine(
+    DB_URL, echo=False, poolclass=AsyncAdaptedQueuePool, pool_size=1
+)
 
 
 Methods = Literal["Naked SQLAlchemy", "SQLAlchemy Core", "SQLAlchemy ORM"]
 SQL_EXECUTION_TIMES: list[float] = []
+SAMPLE_SIZE = 10
+TIMED_METRICS = (
+    "execution_time",
+    "rss_memory_mb",
+    "python_execution_time",
+    "sql_execution_time",
+)
+
+
+class BaseSQL(DeclarativeBase): ...
 
 
-class BaseSQL(MappedAsDataclass, DeclarativeBase): ...
+@sa.event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-200000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
 
 @sa.event.listens_for(engine.sync_engine, "before_cursor_execute")
 def _record_query_start(conn, cursor, statement, parameters, context, executemany):
-    conn.info["query_start"] = datetime.now()
+    conn.info["query_start"] = time.perf_counter_ns()
 
 
 @sa.event.listens_for(engine.sync_engine, "after_cursor_execute")
 def _calculate_query_run_time(
     conn, cursor, statement, parameters, context, executemany
 ):
-    final_time = (datetime.now() - conn.info["query_start"]).total_seconds()
+    final_time = (time.perf_counter_ns() - conn.info["query_start"]) / 1e9
     SQL_EXECUTION_TIMES.append(final_time)
 
 
@@ -52,59 +74,78 @@ class E1(BaseSQL):
     __tablename__ = "E1"
     event: Mapped[str] = mapped_column(sa.String(), primary_key=True)
     created_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True))
-    id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
-    )
+    id: Mapped[str] = mapped_column(primary_key=True, default=lambda: str(uuid4()))
     author_id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
+        primary_key=True, default=lambda: str(uuid4())
     )
 
 
+# built once, so each run only binds new parameters.
+# full rows are selected on purpose, hydrating them is what the benchmark compares.
+SELECT_EVENTS = sa.select(E1)
+UPDATE_EVENTS = (
+    sa.update(E1)
+    .where(E1.id.in_(sa.bindparam("ids_to_update", expanding=True)))
+    .values(event=sa.bindparam("new_event"))
+    .returning(E1)
+)
+
+naked_sqla_db = AsyncSessionFactory(engine)
+sqlalchemy_orm_db = async_sessionmaker(engine, expire_on_commit=False)
+
+
 @asynccontextmanager
 async def init_naked_sqla_db():
     """Initialize Naked SQLAlchemy Session"""
-    db = AsyncSessionFactory(engine)
-    yield db
+    yield naked_sqla_db
 
 
 @asynccontextmanager
 async def init_sqlalchemy_orm_db():
     """Initialize SQLAlchemy ORM Session"""
-    async_session = async_sessionmaker(engine, expire_on_commit=False)
-    yield async_session
+    yield sqlalchemy_orm_db
 
 
 async def refetch_all(session: Union[AsyncSession, sa_AsyncSession]):
     """Fetch all records using Naked SQLAlchemy and perform random updates using .update()"""
-    result = (await session.scalars(sa.select(E1))).all()
-    ids = [record.id for record in result]
-    ids_to_update = random.sample(ids, min(10, len(ids)))
+    result = await session.stream_scalars(
+        SELECT_EVENTS, execution_options={"yield_per": 1000}
+    )
+    # reservoir sampling (algorithm R), so the ids never have to be kept in a list
+    ids_to_update: list[str] = []
+    count = 0
+    async for partition in result.partitions():
+        for record in partition:
+            if count < SAMPLE_SIZE:
+                ids_to_update.append(record.id)
+            else:
+                index = random.randrange(count + 1)
+                if index < SAMPLE_SIZE:
+                    ids_to_update[index] = record.id
+            count += 1
+
     new_event = f"Updated event {random.randint(1, 100)}"
     (
         await session.execute(
-            sa.update(E1)
-            .where(E1.id.in_(ids_to_update))
-            .values(event=new_event)
-            .returning(E1)
+            UPDATE_EVENTS,
+            {"ids_to_update": ids_to_update, "new_event": new_event},
         )
     ).all()
-    return len(result)
+    return count
 
 
 async def refetch_with_conn(conn: AsyncConnection):
-    result = (await conn.execute(sa.select(E1))).mappings().all()
+    result = (await conn.execute(SELECT_EVENTS)).mappings().all()
     ids = [record["id"] for record in result]
-    ids_to_update = random.sample(ids, min(10, len(ids)))
+    ids_to_update = random.sample(ids, min(SAMPLE_SIZE, len(ids)))
     new_event = f"Updated event {random.randint(1, 100)}"
     (
         await conn.execute(
-            sa.update(E1)
-            .where(E1.id.in_(ids_to_update))
-            .values(event=new_event)
-            .returning(E1)
+            UPDATE_EVENTS,
+            {"ids_to_update": ids_to_update, "new_event": new_event},
         )
     ).all()
-    return len(result)
+    return len(ids)
 
 
 @dataclass
@@ -118,8 +159,11 @@ class BenchmarkResult:
     sql_execution_time: float
 
 
-async def run_benchmark(method: Methods) -> BenchmarkResult:
-    tracemalloc.start()
+async def run_benchmark(method: Methods, trace_memory: bool = False) -> BenchmarkResult:
+    """Run a single benchmark, tracing allocations only if `trace_memory` is True,
+    since tracemalloc slows down every allocation and would skew the timings."""
+    if trace_memory:
+        tracemalloc.start()
     process = psutil.Process()
     cpu_before = time.process_time()
 
@@ -141,8 +185,10 @@ async def run_benchmark(method: Methods) -> BenchmarkResult:
         assert_never(method)
 
     cpu_after = time.process_time()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    peak = 0
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
     mem_info = process.memory_info()
 
     execution_time = cpu_after - cpu_before
@@ -171,45 +217,41 @@ async def benchmark():
     # methods: list[Methods] = ["Naked SQLAlchemy", "SQLAlchemy ORM", "SQLAlchemy Core"]
     methods: list[Methods] = ["SQLAlchemy ORM", "Naked SQLAlchemy", "SQLAlchemy Core"]
     num_runs = 5
-    all_results = {method: [] for method in methods}
+    # one list per metric, filled while running, so medians don't re-walk the results
+    samples: dict[Methods, dict[str, list[float]]] = {
+        method: {metric: [] for metric in TIMED_METRICS} for method in methods
+    }
+    rows_fetched: dict[Methods, int] = {}
+    memory_used_mb: dict[Methods, float] = {}
     console = Console()
 
     for method in methods:
         console.print(f"\n[bold cyan]Running benchmark for {method}[/bold cyan]")
         for i in range(num_runs):
             result = await run_benchmark(method)
-            all_results[method].append(result)
+            for metric, values in samples[method].items():
+                values.append(getattr(result, metric))
+            # Assuming rows fetched is the same each time
+            rows_fetched[method] = result.rows_fetched
             console.print(
                 f"Run {i + 1}/{num_runs}: "
                 f"CPU Time: {result.execution_time:.2f}s, "
-                f"Memory Used: {result.memory_used_mb:.2f}MB, "
+                f"RSS Memory: {result.rss_memory_mb:.2f}MB, "
             )
 
-    median_results: list[BenchmarkResult] = []
+        traced_result = await run_benchmark(method, trace_memory=True)
+        memory_used_mb[method] = traced_result.memory_used_mb
+        console.print(f"Memory Used: {traced_result.memory_used_mb:.2f}MB")
 
-    for method in methods:
-        method_results = all_results[method]
-        # Assuming rows fetched is the same each time
-        rows_fetched = method_results[0].rows_fetched
-        median_execution_time = median([r.execution_time for r in method_results])
-        median_memory_used_mb = median([r.memory_used_mb for r in method_results])
-        median_rss_memory_mb = median([r.rss_memory_mb for r in method_results])
-        python_execution_time = median(
-            [r.python_execution_time for r in method_results]
-        )
-        sql_execution_time = median([r.sql_execution_time for r in method_results])
-
-        median_results.append(
-            BenchmarkResult(
-                method=method,
-                rows_fetched=rows_fetched,
-                execution_time=median_execution_time,
-                memory_used_mb=median_memory_used_mb,
-                rss_memory_mb=median_rss_memory_mb,
-                python_execution_time=python_execution_time,
-                sql_execution_time=sql_execution_time,
-            )
+    median_results = [
+        BenchmarkResult(
+            method=method,
+            rows_fetched=rows_fetched[method],
+            memory_used_mb=memory_used_mb[method],
+            **{metric: median(values) for metric, values in samples[method].items()},
         )
+        for method in methods
+    ]
 
     table = Table(title="Benchmark Median Results")
     table.add_column("Method", justify="left", style="cyan", no_wrap=True)
@@ -232,6 +274,7 @@ async def benchmark():
         )
 
     console.print("\n", table)
+    await engine.dispose()
 
 
 if __name__ == "__main__":
@@ -2,3 +2,17 @@ class BaseNakedSQLAException(Exception):
     """Base exception for all exceptions raised by NakedSQLA."""
 
     pass
+
+
+class ParametersMismatch(BaseNakedSQLAException):
+    def __init__(self, statements: int, parameters: int):
+        super().__init__(
+            f"Got {parameters} parameters for {statements} statements. Expected one per statement"
+        )
+
+
+class InvalidStatement(BaseNakedSQLAException):
+    def __init__(self, statement_type: type):
+        super().__init__(
+            f"Invalid statement type: {statement_type!r}. Expected: Executable"
+        )
@@ -9,23 +9,37 @@ So you should always commit or rollback the transaction after you are done with
 Session Factory is a factory for creating sessions. You should use this factory to create a new session every time you need to start a new transaction.
 """
 
-from contextlib import asynccontextmanager
-from typing import Any, Literal, Optional, Tuple, TypeVar, overload
+from types import TracebackType
+from typing import (
+    Any,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
 
-from sqlalchemy import ScalarResult
+from sqlalchemy import QueuePool, ScalarResult
 from sqlalchemy.engine import Result, TupleResult
 from sqlalchemy.engine.interfaces import (
     _CoreAnyExecuteParams,
     _CoreKnownExecutionOptions,
 )
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
-from sqlalchemy.sql import dml
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncResult,
+    AsyncScalarResult,
+)
 from sqlalchemy.sql.base import Executable
 from sqlalchemy.sql.selectable import TypedReturnsRows
 from typing_extensions import assert_never
 
 from naked_sqla.exception import BaseNakedSQLAException
 from naked_sqla.om import bulk_persistent, context
+from naked_sqla.om.dispatch import _DispatchTable, _with_parameters
 
 _T = TypeVar("_T", bound=Any)
 
@@ -35,6 +49,55 @@ class InvalidSessionState(BaseNakedSQLAException):
         super().__init__(f"Invalid transaction state: {state}. Expected: {expected}")
 
 
+_DISPATCH = _DispatchTable(
+    bulk_persistent.orm_execute_statement, context.orm_execute_statement
+)
+_STREAM_DISPATCH = _DispatchTable(
+    bulk_persistent.orm_stream_statement, context.orm_stream_statement
+)
+
+
+class _AsyncSessionContext:
+    """
+    The context manager returned by `AsyncSessionFactory.begin`.
+
+    Written as a class instead of an `asynccontextmanager`, so entering a session doesn't create a generator.
+    """
+
+    __slots__ = ("_transaction", "factory", "session")
+
+    def __init__(self, factory: "AsyncSessionFactory"):
+        self.factory = factory
+
+    async def __aenter__(self) -> "AsyncSession":
+        self._transaction = self.factory.engine.begin()
+        self.session = AsyncSession(await self._transaction.__aenter__())
+        return self.session
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        # on error, engine.begin() rolls the transaction back itself
+        if exc_type is None:
+            session = self.session
+            try:
+                # the session already knows if it was committed or rolled back,
+                # so the connection doesn't have to be asked about it.
+                if session.state == "open":
+                    if self.factory.auto_commit:
+                        await session.commit()
+                    else:
+                        await session.rollback()
+            except BaseException as err:
+                await self._transaction.__aexit__(type(err), err, err.__traceback__)
+                raise
+
+        return await self._transaction.__aexit__(exc_type, exc, traceback)
+
+
 class AsyncSessionFactory:
     """
     A factory for creating async sessions.
@@ -80,12 +143,44 @@ class AsyncSessionFactory:
 
     """
 
+    __slots__ = ("auto_commit", "engine")
+
     def __init__(self, engine: AsyncEngine, *, auto_commit: bool = True):
         self.engine = engine
         self.auto_commit = auto_commit
 
-    @asynccontextmanager
-    async def begin(self):
+    async def prewarm(self, connections: Optional[int] = None):
+        """
+        Open connections ahead of time, so the first sessions don't pay for connecting to the database.
+
+        The connections are returned to the pool right away, and `begin` checks them out from there.
+        This only helps with a pool that keeps connections (the default one), with `NullPool`
+        every session opens a new connection anyway.
+
+        params:
+            connections:
+                How many connections to open. Defaults to the size of the pool, or 1 if the pool has no fixed size.
+
+        Example:
+            ```python
+            async def main():
+                await db.prewarm()
+            ```
+        """
+        if connections is None:
+            # other pools have no size to fill (e.x: `size` of SingletonThreadPool is an int)
+            pool = self.engine.pool
+            connections = pool.size() if isinstance(pool, QueuePool) else 1
+
+        opened: list[AsyncConnection] = []
+        try:
+            for _ in range(connections):
+                opened.append(await self.engine.connect())
+        finally:
+            for conn in opened:
+                await conn.close()
+
+    def begin(self) -> "_AsyncSessionContext":
         """
         Create a new session, commits the transaction if auto_commit is True.
         Returns a context manager that yields a Session object.
@@ -107,19 +202,7 @@ class AsyncSessionFactory:
             ```
         """
 
-        async with self.engine.begin() as conn:
-            try:
-                yield AsyncSession(conn)
-                if self.auto_commit:
-                    await conn.commit()
-                else:
-                    if conn.in_transaction():
-                        await conn.rollback()
-
-            except Exception as err:
-                if self.auto_commit:
-                    await conn.rollback()
-                raise err
+        return _AsyncSessionContext(self)
 
 
 class AsyncSession:
@@ -188,9 +271,22 @@ class AsyncSession:
         ```
     """
 
+    __slots__ = ("_autocommit", "conn", "state")
+
     def __init__(self, conn: AsyncConnection):
         self.conn = conn
         self.state: Literal["open", "closed"] = "open"
+        # in autocommit mode every statement is already committed by the database,
+        # so commit and rollback only have to close the session.
+        # the connection's options include the engine's, so `engine.execution_options(isolation_level=...)`
+        # is seen here. with `create_engine(isolation_level=...)` the session still calls commit,
+        # which sqlalchemy skips itself.
+        sync_connection = conn.sync_connection
+        self._autocommit = (
+            sync_connection is not None
+            and sync_connection.get_execution_options().get("isolation_level")
+            == "AUTOCOMMIT"
+        )
 
     async def commit(self):
         """Commit the transaction."""
@@ -198,7 +294,8 @@ class AsyncSession:
             raise InvalidSessionState(self.state, "open")
 
         elif self.state == "open":
-            await self.conn.commit()
+            if not self._autocommit:
+                await self.conn.commit()
             self.state = "closed"
         else:
             assert_never(self.state)
@@ -209,7 +306,8 @@ class AsyncSession:
             raise InvalidSessionState(self.state, "open")
 
         elif self.state == "open":
-            await self.conn.rollback()
+            if not self._autocommit:
+                await self.conn.rollback()
             self.state = "closed"
         else:
             assert_never(self.state)
@@ -253,28 +351,48 @@ class AsyncSession:
                 The execution options to pass to the query.
         """
 
-        if (
-            isinstance(statement, dml.Insert)
-            or isinstance(statement, dml.Update)
-            or isinstance(statement, dml.Delete)
-        ):
-            return await bulk_persistent.orm_execute_statement(
-                self.conn,
-                statement,  # type: ignore
-                parameters=parameters,
-                execution_options=execution_options,
-            )
+        return await _DISPATCH[type(statement)](
+            self.conn,
+            statement,
+            parameters=parameters,
+            execution_options=execution_options,
+        )
 
-        elif isinstance(statement, Executable):
-            return await context.orm_execute_statement(
-                self.conn,
-                statement,
-                parameters=parameters,
-                execution_options=execution_options,
-            )
+    async def execute_many(
+        self,
+        statements: Sequence[Executable],
+        parameters: Optional[Sequence[Optional[_CoreAnyExecuteParams]]] = None,
+        *,
+        execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    ) -> list[Result[Any]]:
+        """
+        Execute many query statements back to back and return their results, in order.
 
-        else:
-            assert_never(statement)
+        Statements are executed one after another, same as calling `execute` for each of them,
+        so an error is raised by the statement that caused it, and the ones after it are not sent.
+
+        params:
+            statements:
+                The query statements to execute.
+            parameters:
+                The parameters to pass to each query, one per statement.
+            execution_options:
+                The execution options to pass to every query.
+
+        Example:
+            ```python
+            async def main():
+                async with db.begin() as session:
+                    results = await session.execute_many(
+                        [sa.insert(Book), sa.update(Book).values(name="new name")],
+                        [[{"name": "book 1"}, {"name": "book 2"}], None],
+                    )
+            ```
+        """
+        return [
+            await self.execute(statement, params, execution_options=execution_options)
+            for statement, params in _with_parameters(statements, parameters)
+        ]
 
     @overload
     async def tuples(
@@ -361,8 +479,122 @@ class AsyncSession:
                 The execution options to pass to the query
         """
         result = (
-            await self.execute(
-                statement, parameters, execution_options=execution_options
+            await _DISPATCH[type(statement)](
+                self.conn,
+                statement,
+                parameters=parameters,
+                execution_options=execution_options,
+                scalars=True,
             )
         ).scalars()
         return result
+
+    @overload
+    async def stream(
+        self,
+        statement: TypedReturnsRows[_T],
+        parameters: Optional[_CoreAnyExecuteParams] = None,
+        *,
+        execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    ) -> AsyncResult[_T]: ...
+
+    @overload
+    async def stream(
+        self,
+        statement: Executable,
+        parameters: Optional[_CoreAnyExecuteParams] = None,
+        *,
+        execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    ) -> AsyncResult[Any]: ...
+
+    async def stream(
+        self,
+        statement: Executable,
+        parameters: Optional[_CoreAnyExecuteParams] = None,
+        *,
+        execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    ) -> AsyncResult[Any]:
+        """
+        Execute a query statement and return the result as a stream.
+
+        Rows are fetched from a server side cursor while you iterate, instead of being loaded at once.
+        Pass `yield_per` in the execution options to control how many rows are fetched at a time.
+
+        params:
+            statement:
+                The query statement to execute.
+            parameters:
+                The parameters to pass to the query.
+            execution_options:
+                The execution options to pass to the query.
+
+        Example:
+            ```python
+            async def main():
+                async with db.begin() as session:
+                    result = await session.stream(
+                        sa.select(Book), execution_options={"yield_per": 1000}
+                    )
+                    async for partition in result.partitions():
+                        ...
+            ```
+        """
+        return await self._stream(statement, parameters, execution_options)
+
+    @overload
+    async def stream_scalars(
+        self,
+        statement: TypedReturnsRows[Tuple[_T]],
+        parameters: Optional[_CoreAnyExecuteParams] = None,
+        *,
+        execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    ) -> AsyncScalarResult[_T]: ...
+
+    @overload
+    async def stream_scalars(
+        self,
+        statement: Executable,
+        parameters: Optional[_CoreAnyExecuteParams] = None,
+        *,
+        execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    ) -> AsyncScalarResult[Any]: ...
+
+    async def stream_scalars(
+        self,
+        statement: Executable,
+        parameters: Optional[_CoreAnyExecuteParams] = None,
+        *,
+        execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    ) -> AsyncScalarResult[Any]:
+        """
+        Execute a query statement and return the result as a stream of scalars.
+
+        Same as `stream`, but returns only the first entity of each row, like `scalars` does.
+
+        params:
+            statement:
+                The query statement to execute.
+            parameters:
+                The parameters to pass to the query.
+            execution_options:
+                The execution options to pass to the query
+        """
+        result = (
+            await self._stream(statement, parameters, execution_options, scalars=True)
+        ).scalars()
+        return result
+
+    async def _stream(
+        self,
+        statement: Executable,
+        parameters: Optional[_CoreAnyExecuteParams],
+        execution_options: Optional[_CoreKnownExecutionOptions],
+        scalars: bool = False,
+    ) -> AsyncResult[Any]:
+        return await _STREAM_DISPATCH[type(statement)](
+            self.conn,
+            statement,
+            parameters=parameters,
+            execution_options=execution_options,
+            scalars=scalars,
+        )
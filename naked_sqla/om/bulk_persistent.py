@@ -6,56 +6,76 @@ from sqlalchemy.engine.interfaces import (
     _CoreAnyExecuteParams,
     _CoreKnownExecutionOptions,
 )
-from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncResult
 from sqlalchemy.sql import dml
 
-from naked_sqla.om.context import QueryContext
+from naked_sqla.om.context import _query_context
 from naked_sqla.om.loading import instances
 
 
 def _return_orm_returning(
     result: CursorResult,
     statement: dml.Insert,
-    execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    scalars: bool = False,
 ):
     execution_context = result.context
     compile_state = execution_context.compiled.compile_state  # type: ignore
-    execution_options = execution_options or {}
-
-    if (
-        compile_state.from_statement_ctx  # type: ignore
-        and not compile_state.from_statement_ctx.compile_options._is_star  # type: ignore
-    ):
-        load_options = execution_options.get(
-            "_sa_orm_load_options", QueryContext.default_load_options
-        )
 
-        querycontext = QueryContext(
-            compile_state.from_statement_ctx,  # type: ignore
-            compile_state.select_statement,  # type: ignore
-            statement,  # type: ignore
-            {},
-            load_options,
-            execution_options,
-            None,
-        )
-        return instances(result, querycontext)
-    else:
+    from_statement_ctx = compile_state.from_statement_ctx  # type: ignore
+    if from_statement_ctx is None or from_statement_ctx.compile_options._is_star:
         return result
 
+    querycontext = _query_context(
+        from_statement_ctx,
+        compile_state.select_statement,  # type: ignore
+        statement,  # type: ignore
+        execution_context.execution_options,  # type: ignore
+    )
+    return instances(result, querycontext, scalars=scalars)
+
 
 async def orm_execute_statement(
     conn: AsyncConnection,
     statement: dml.Insert,
     parameters: Optional[_CoreAnyExecuteParams] = None,
     execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    scalars: bool = False,
 ):
+    # a list of parameters is passed through as is, and not rewritten to a multi VALUES insert.
+    # sqlalchemy already batches it: psycopg2 and any insert with RETURNING go through
+    # "insertmanyvalues", mysql drivers rewrite executemany inserts themselves,
+    # and sqlite's executemany never leaves the process.
     result = await conn.execute(
-        statement, parameters=parameters, execution_options=execution_options
+        statement,
+        parameters=parameters,
+        execution_options=execution_options,
     )
-    if not bool(statement._returning):
+    if not statement._returning:
         return result
-    return _return_orm_returning(result, statement, execution_options=execution_options)
+    return _return_orm_returning(result, statement, scalars=scalars)
+
+
+async def orm_stream_statement(
+    conn: AsyncConnection,
+    statement: dml.Insert,
+    parameters: Optional[_CoreAnyExecuteParams] = None,
+    execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    scalars: bool = False,
+):
+    result = await conn.stream(
+        statement,
+        parameters=parameters,
+        execution_options=execution_options,
+    )
+    if not statement._returning:
+        return result
+    return AsyncResult(
+        _return_orm_returning(
+            result._real_result,  # type: ignore
+            statement,
+            scalars=scalars,
+        )
+    )
 
 
 def sync_orm_execute_statement(
@@ -63,10 +83,13 @@ def sync_orm_execute_statement(
     statement: dml.Insert,
     parameters: Optional[_CoreAnyExecuteParams] = None,
     execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    scalars: bool = False,
 ):
     result = conn.execute(
-        statement, parameters=parameters, execution_options=execution_options
+        statement,
+        parameters=parameters,
+        execution_options=execution_options,
     )
-    if not bool(statement._returning):
+    if not statement._returning:
         return result
-    return _return_orm_returning(result, statement, execution_options=execution_options)
+    return _return_orm_returning(result, statement, scalars=scalars)
@@ -3,12 +3,13 @@ from __future__ import annotations
 from typing import Any, Optional, Type, TypeVar, Union
 
 from sqlalchemy import Connection, util
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.engine.interfaces import (
     _CoreAnyExecuteParams,
     _CoreKnownExecutionOptions,
     _CoreSingleExecuteParams,
 )
-from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncResult
 from sqlalchemy.orm.context import FromStatement, ORMCompileState
 from sqlalchemy.sql.base import CompileState, Executable, Options
 from sqlalchemy.sql.selectable import Select, SelectLabelStyle
@@ -22,11 +23,25 @@ _T = TypeVar("_T", bound=Any)
 
 _EMPTY_DICT = util.immutabledict()
 
-
 LABEL_STYLE_LEGACY_ORM = SelectLabelStyle.LABEL_STYLE_LEGACY_ORM
 
 
 class QueryContext:
+    # a context is created for every execution with yield_per or load options,
+    # so slots keep it small and cheap to allocate.
+    __slots__ = (
+        "attributes",
+        "bind_arguments",
+        "compile_state",
+        "execution_options",
+        "load_options",
+        "params",
+        "partials",
+        "query",
+        "user_passed_query",
+        "yield_per",
+    )
+
     runid: int
 
     compile_state: ORMCompileState
@@ -66,8 +81,77 @@ class QueryContext:
 
         self.params = params
 
-        self.attributes = dict(compile_state.attributes)  # type: ignore
-        self.yield_per = load_options._yield_per
+        # read only in the loader, so the compile state attributes are shared, not copied
+        self.attributes = compile_state.attributes  # type: ignore
+        self.yield_per = self.execution_options.get("yield_per") or (
+            load_options._yield_per
+        )
+
+
+_DEFAULT_LOAD_OPTIONS = QueryContext.default_load_options
+
+
+# query contexts built without yield_per or load options only depend on the compile state,
+# so they are kept in its attributes and reused across executions.
+# the entry lives and dies with the compile state, which sqlalchemy keeps in the compiled cache.
+# the loader never reads `user_passed_query`, so keeping the one from the first execution is fine.
+_QUERY_CONTEXT_KEY = "naked_sqla_query_context"
+
+
+def _query_context(
+    compile_state: CompileState,
+    statement: Union[Select[Any], FromStatement[Any]],
+    user_passed_query: Union[Select[Any], FromStatement[Any]],
+    execution_options: Optional[_CoreKnownExecutionOptions] = None,
+) -> QueryContext:
+    if not execution_options or (
+        execution_options.get("yield_per") is None
+        and "_sa_orm_load_options" not in execution_options
+    ):
+        attributes = compile_state.attributes  # type: ignore
+        querycontext = attributes.get(_QUERY_CONTEXT_KEY)
+        if querycontext is None:
+            querycontext = attributes[_QUERY_CONTEXT_KEY] = QueryContext(
+                compile_state,
+                statement,
+                user_passed_query,
+                _EMPTY_DICT,
+                _DEFAULT_LOAD_OPTIONS,
+                None,
+                None,
+            )
+        return querycontext
+
+    load_options = execution_options.get(  # type: ignore
+        "_sa_orm_load_options", _DEFAULT_LOAD_OPTIONS
+    )
+    return QueryContext(
+        compile_state,
+        statement,
+        user_passed_query,
+        _EMPTY_DICT,
+        load_options,
+        execution_options,
+        None,
+    )
+
+
+def _orm_instances(result: CursorResult[Any], scalars: bool = False):
+    execution_context = result.context
+    assert execution_context.compiled
+    compile_state = execution_context.compiled.compile_state
+    assert compile_state
+
+    statement = compile_state.statement
+    # merged by sqlalchemy from the engine, connection, statement and execute() options,
+    # so a yield_per set on the statement itself is seen too.
+    querycontext = _query_context(
+        compile_state,
+        statement,  # type: ignore
+        statement,  # type: ignore
+        execution_context.execution_options,  # type: ignore
+    )
+    return instances(result, querycontext, scalars=scalars)
 
 
 async def orm_execute_statement(
@@ -75,32 +159,31 @@ async def orm_execute_statement(
     statement: Executable,
     parameters: Optional[_CoreAnyExecuteParams] = None,
     execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    scalars: bool = False,
 ):
     result = await conn.execute(
         statement,
         parameters=parameters,
         execution_options=execution_options,
     )
-    execution_context = result.context
-    assert execution_context.compiled
-    compile_state = execution_context.compiled.compile_state
-    assert compile_state
+    return _orm_instances(result, scalars=scalars)
 
-    execution_options = execution_options or {}
-    load_options = execution_options.get(  # type: ignore
-        "_sa_orm_load_options", QueryContext.default_load_options
-    )
 
-    querycontext = QueryContext(
-        compile_state,
-        compile_state.statement,
-        compile_state.statement,
-        {},
-        load_options,
-        execution_options,
-        None,
+async def orm_stream_statement(
+    conn: AsyncConnection,
+    statement: Executable,
+    parameters: Optional[_CoreAnyExecuteParams] = None,
+    execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    scalars: bool = False,
+) -> AsyncResult[Any]:
+    result = await conn.stream(
+        statement,
+        parameters=parameters,
+        execution_options=execution_options,
+    )
+    return AsyncResult(
+        _orm_instances(result._real_result, scalars=scalars)  # type: ignore
     )
-    return instances(result, querycontext)
 
 
 def sync_orm_execute_statement(
@@ -108,29 +191,11 @@ def sync_orm_execute_statement(
     statement: Executable,
     parameters: Optional[_CoreAnyExecuteParams] = None,
     execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    scalars: bool = False,
 ):
     result = conn.execute(
         statement,
         parameters=parameters,
         execution_options=execution_options,
     )
-    execution_context = result.context
-    assert execution_context.compiled
-    compile_state = execution_context.compiled.compile_state
-    assert compile_state
-
-    execution_options = execution_options or {}
-    load_options = execution_options.get(  # type: ignore
-        "_sa_orm_load_options", QueryContext.default_load_options
-    )
-
-    querycontext = QueryContext(
-        compile_state,
-        compile_state.statement,
-        compile_state.statement,
-        {},
-        load_options,
-        execution_options,
-        None,
-    )
-    return instances(result, querycontext)
+    return _orm_instances(result, scalars=scalars)
@@ -0,0 +1,48 @@
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from sqlalchemy.engine.interfaces import _CoreAnyExecuteParams
+from sqlalchemy.sql import dml
+from sqlalchemy.sql.base import Executable
+
+from naked_sqla.exception import InvalidStatement, ParametersMismatch
+
+_Handler = Callable[..., Any]
+
+_DML_TYPES = (dml.Insert, dml.Update, dml.Delete)
+
+
+class _DispatchTable(dict[type, _Handler]):
+    """
+    Maps the exact type of statement to the function that executes it.
+
+    The type is only classified the first time it's seen, (e.x: postgresql insert is resolved as an insert),
+    after that, executing a statement costs a single dict lookup.
+    """
+
+    def __init__(self, dml_handler: _Handler, handler: _Handler):
+        super().__init__({statement_type: dml_handler for statement_type in _DML_TYPES})
+        self.dml_handler = dml_handler
+        self.handler = handler
+
+    def __missing__(self, statement_type: type) -> _Handler:
+        if issubclass(statement_type, _DML_TYPES):
+            handler = self.dml_handler
+        elif issubclass(statement_type, Executable):
+            handler = self.handler
+        else:
+            raise InvalidStatement(statement_type)
+
+        self[statement_type] = handler
+        return handler
+
+
+def _with_parameters(
+    statements: Sequence[Executable],
+    parameters: Optional[Sequence[Optional[_CoreAnyExecuteParams]]],
+) -> Iterator[tuple[Executable, Optional[_CoreAnyExecuteParams]]]:
+    """Pair each statement of `execute_many` with its parameters, `None` when none are given."""
+    if parameters is None:
+        parameters = [None] * len(statements)
+    elif len(parameters) != len(statements):
+        raise ParametersMismatch(len(statements), len(parameters))
+    return zip(statements, parameters)
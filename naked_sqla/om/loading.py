@@ -13,7 +13,6 @@ from sqlalchemy.orm.context import (
     _QueryEntity,
 )
 from sqlalchemy.util import EMPTY_DICT
-from typing_extensions import assert_never
 
 from naked_sqla.exception import BaseNakedSQLAException
 
@@ -43,7 +42,9 @@ _T = TypeVar("_T", bound=Any)
 _O = TypeVar("_O", bound=object)
 
 
-def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
+def instances(
+    cursor: CursorResult[Any], context: QueryContext, scalars: bool = False
+) -> Result[Any]:
     """Return a :class:`.Result` given an ORM query context.
 
     :param cursor: a :class:`.CursorResult`, generated by a statement
@@ -51,6 +52,9 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
 
     :param context: a :class:`.QueryContext` object
 
+    :param scalars: only the first entity is going to be read, so the
+     other entities are not processed at all.
+
     :return: a :class:`.Result` object representing ORM results
 
     .. versionchanged:: 1.4 The instances() function now uses
@@ -60,18 +64,23 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
 
     compile_state = context.compile_state
     filtered = compile_state._has_mapper_entities
-    single_entity = (
-        not context.load_options._only_return_tuples
-        and len(compile_state._entities) == 1
-        and compile_state._entities[0].supports_single_entity
-    )
+    entities = compile_state._entities
+    if scalars and entities[0].supports_single_entity:
+        entities = entities[:1]
+        single_entity = True
+    else:
+        single_entity = (
+            not context.load_options._only_return_tuples
+            and len(entities) == 1
+            and entities[0].supports_single_entity
+        )
 
     try:
         (process, labels, extra) = list(
             zip(
                 *[
                     row_processor(query_entity, context, cursor)
-                    for query_entity in context.compile_state._entities
+                    for query_entity in entities
                 ]
             )
         )
@@ -97,8 +106,7 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
                 fetch = cursor._raw_all_rows()
 
             if single_entity:
-                proc = process[0]  # type: ignore
-                rows = [proc(row) for row in fetch]
+                rows = list(map(process[0], fetch))  # type: ignore
             else:
                 rows = [tuple([proc(row) for proc in process]) for row in fetch]  # type: ignore
 
@@ -148,10 +156,8 @@ def row_processor(
         return mapper_entity_row_processor(entity, context, cursor)
     elif isinstance(entity, _ColumnEntity):
         return entity.row_processor(context, cursor)
-    elif isinstance(entity, _QueryEntity):
-        raise UnknownEntity(entity)
-    else:
-        assert_never(entity)
+
+    raise UnknownEntity(entity)
 
 
 def mapper_entity_row_processor(
@@ -176,7 +182,9 @@ def _instance_processor(query_entity, mapper, context, result, path, adapter):
     which processes rows into mapped instances."""
 
     compile_state = context.compile_state
-    getter_key = ("getters", mapper)
+    # not sqlalchemy's ("getters", mapper) key: the compiled statement, and with it
+    # the compile state, is shared with sqlalchemy's own Session on the same engine.
+    getter_key = ("naked_sqla_getters", mapper)
     getters = path.get(compile_state.attributes, getter_key, None)
 
     if getters is None:
@@ -212,11 +220,15 @@ def _instance_processor(query_entity, mapper, context, result, path, adapter):
     cached_populators = getters["cached_populators"]
     populators = {key: list(value) for key, value in cached_populators.items()}
 
+    # bound once here, since _instance runs for every single row
+    quick_populators = populators["quick"]
+    new_instance = mapper.class_manager.new_instance
+
     def _instance(row):
-        instance = mapper.class_manager.new_instance()
+        instance = new_instance()
         dict_ = instance_dict(instance)
 
-        for key, getter in populators["quick"]:
+        for key, getter in quick_populators:
             dict_[key] = getter(row)
         return instance
 
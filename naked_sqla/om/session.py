@@ -9,24 +9,69 @@ So you should always commit or rollback the transaction after you are done with
 Session Factory is a factory for creating sessions. You should use this factory to create a new session every time you need to start a new transaction.
 """
 
-from contextlib import contextmanager
-from typing import Any, Literal, Optional, TypeVar, overload
+from types import TracebackType
+from typing import Any, Literal, Optional, Sequence, Type, TypeVar, overload
 
-from sqlalchemy import Connection, Engine, ScalarResult
+from sqlalchemy import Connection, Engine, QueuePool, ScalarResult
 from sqlalchemy.engine import Result, TupleResult
 from sqlalchemy.engine.interfaces import (
     _CoreAnyExecuteParams,
     _CoreKnownExecutionOptions,
 )
-from sqlalchemy.sql import dml
 from sqlalchemy.sql.base import Executable
 from sqlalchemy.sql.selectable import TypedReturnsRows
 from typing_extensions import assert_never
 
 from naked_sqla.om import bulk_persistent, context
+from naked_sqla.om.dispatch import _DispatchTable, _with_parameters
 
 _T = TypeVar("_T", bound=Any)
 
+_DISPATCH = _DispatchTable(
+    bulk_persistent.sync_orm_execute_statement, context.sync_orm_execute_statement
+)
+
+
+class _SessionContext:
+    """
+    The context manager returned by `SessionFactory.begin`.
+
+    Written as a class instead of a `contextmanager`, so entering a session doesn't create a generator.
+    """
+
+    __slots__ = ("_transaction", "factory", "session")
+
+    def __init__(self, factory: "SessionFactory"):
+        self.factory = factory
+
+    def __enter__(self) -> "Session":
+        self._transaction = self.factory.engine.begin()
+        self.session = Session(self._transaction.__enter__())
+        return self.session
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        # on error, engine.begin() rolls the transaction back itself
+        if exc_type is None:
+            session = self.session
+            try:
+                # the session already knows if it was committed or rolled back,
+                # so the connection doesn't have to be asked about it.
+                if session.state == "open":
+                    if self.factory.auto_commit:
+                        session.commit()
+                    else:
+                        session.rollback()
+            except BaseException as err:
+                self._transaction.__exit__(type(err), err, err.__traceback__)
+                raise
+
+        return self._transaction.__exit__(exc_type, exc, traceback)
+
 
 class SessionFactory:
     """
@@ -74,12 +119,38 @@ class SessionFactory:
 
     """
 
+    __slots__ = ("auto_commit", "engine")
+
     def __init__(self, engine: Engine, *, auto_commit: bool = True):
         self.engine = engine
         self.auto_commit = auto_commit
 
-    @contextmanager
-    def begin(self):
+    def prewarm(self, connections: Optional[int] = None):
+        """
+        Open connections ahead of time, so the first sessions don't pay for connecting to the database.
+
+        The connections are returned to the pool right away, and `begin` checks them out from there.
+        This only helps with a pool that keeps connections (the default one), with `NullPool`
+        every session opens a new connection anyway.
+
+        params:
+            connections:
+                How many connections to open. Defaults to the size of the pool, or 1 if the pool has no fixed size.
+        """
+        if connections is None:
+            # other pools have no size to fill (e.x: `size` of SingletonThreadPool is an int)
+            pool = self.engine.pool
+            connections = pool.size() if isinstance(pool, QueuePool) else 1
+
+        opened: list[Connection] = []
+        try:
+            for _ in range(connections):
+                opened.append(self.engine.connect())
+        finally:
+            for conn in opened:
+                conn.close()
+
+    def begin(self) -> "_SessionContext":
         """
         Create a new session, commits the transaction if auto_commit is True.
         Returns a context manager that yields a Session object.
@@ -98,19 +169,7 @@ class SessionFactory:
             ```
         """
 
-        with self.engine.begin() as conn:
-            try:
-                yield Session(conn)
-                if self.auto_commit:
-                    conn.commit()
-                else:
-                    if conn.in_transaction():
-                        conn.rollback()
-
-            except Exception as err:
-                if self.auto_commit:
-                    conn.rollback()
-                raise err
+        return _SessionContext(self)
 
 
 class Session:
@@ -177,6 +236,8 @@ class Session:
         ```
     """
 
+    __slots__ = ("conn", "state")
+
     def __init__(self, conn: Connection):
         """
         Initialize a new session.
@@ -242,28 +303,38 @@ class Session:
             execution_options:
                 The execution options to pass to the query.
         """
-        if (
-            isinstance(statement, dml.Insert)
-            or isinstance(statement, dml.Update)
-            or isinstance(statement, dml.Delete)
-        ):
-            return bulk_persistent.sync_orm_execute_statement(
-                self.conn,
-                statement,  # type: ignore
-                parameters=parameters,
-                execution_options=execution_options,
-            )
+        return _DISPATCH[type(statement)](
+            self.conn,
+            statement,
+            parameters=parameters,
+            execution_options=execution_options,
+        )
+
+    def execute_many(
+        self,
+        statements: Sequence[Executable],
+        parameters: Optional[Sequence[Optional[_CoreAnyExecuteParams]]] = None,
+        *,
+        execution_options: Optional[_CoreKnownExecutionOptions] = None,
+    ) -> list[Result[Any]]:
+        """
+        Execute many query statements back to back and return their results, in order.
 
-        elif isinstance(statement, Executable):
-            return context.sync_orm_execute_statement(
-                self.conn,
-                statement,
-                parameters=parameters,
-                execution_options=execution_options,
-            )
+        Statements are executed one after another, same as calling `execute` for each of them,
+        so an error is raised by the statement that caused it, and the ones after it are not sent.
 
-        else:
-            assert_never(statement)
+        params:
+            statements:
+                The query statements to execute.
+            parameters:
+                The parameters to pass to each query, one per statement.
+            execution_options:
+                The execution options to pass to every query.
+        """
+        return [
+            self.execute(statement, params, execution_options=execution_options)
+            for statement, params in _with_parameters(statements, parameters)
+        ]
 
     @overload
     def tuples(
@@ -348,6 +419,12 @@ class Session:
         """
 
         result = (
-            self.execute(statement, parameters, execution_options=execution_options)
+            _DISPATCH[type(statement)](
+                self.conn,
+                statement,
+                parameters=parameters,
+                execution_options=execution_options,
+                scalars=True,
+            )
         ).scalars()
         return result
@@ -55,9 +55,28 @@ def init_view_in_base(cls: Type[DeclarativeBase]):
                 cls.__annotations__[k] = annotation
 
 
+# view names read from the database, cached on the connection for a single create_all() or drop_all() run.
+# so the catalog is queried once per run, no matter how many views the metadata has.
+# each view is only checked once in a run, so views created or dropped by the run itself don't matter.
+_VIEW_NAMES_KEY = "naked_sqla_view_names"
+
+
+def _view_names(connection) -> set[str]:
+    view_names = connection.info.get(_VIEW_NAMES_KEY)
+    if view_names is None:
+        view_names = connection.info[_VIEW_NAMES_KEY] = set(
+            sa.inspect(connection).get_view_names()
+        )
+    return view_names
+
+
+def _forget_view_names(target, connection, **kw):
+    connection.info.pop(_VIEW_NAMES_KEY, None)
+
+
 def _view_exists(ddl, target, connection, **kw):
     try:
-        return ddl.name in sa.inspect(connection).get_view_names()
+        return ddl.name in _view_names(connection)
     except NoInspectionAvailable:
         return False
 
@@ -68,7 +87,9 @@ def _view_doesnt_exist(ddl, target, connection, **kw):
 
 class _View(sa.TableClause):
     exclude_in_sqlite: bool = False
-    inherit_cache: bool = False  # type: ignore
+    # a view is keyed like any table, by its name and columns,
+    # so statements selecting from it are cached by sqlalchemy.
+    inherit_cache: bool = True  # type: ignore
 
     @classmethod
     def from_name(cls, name: str, *columns: sa.ColumnClause[Any], **kw: Any):
@@ -117,33 +138,32 @@ def view_table(name, metadata, selectable, *, cascade=True):
             )
 
 
-        def event_period_view_query():
-            event_transitions = sa.select(
-                Event.author_id,
-                Event.event,
-                Event.created_at,
-                sa.func.lead(Event.created_at)
-                .over(
-                    partition_by=Event.author_id,
-                    order_by=Event.created_at,
-                )
-                .label("next_created_at"),
-            ).subquery()
-
-            event_periods = sa.select(
-                event_transitions.c.author_id,
-                event_transitions.c.event,
-                event_transitions.c.created_at.label("start_datetime"),
-                sa.func.coalesce(event_transitions.c.next_created_at, sa.func.now()).label(
-                    "end_datetime"
-                ),
-            ).select_from(event_transitions)
-            return event_periods
+        # built once at module level
+        event_transitions = sa.select(
+            Event.author_id,
+            Event.event,
+            Event.created_at,
+            sa.func.lead(Event.created_at)
+            .over(
+                partition_by=Event.author_id,
+                order_by=Event.created_at,
+            )
+            .label("next_created_at"),
+        ).subquery()
+
+        EVENT_PERIOD_QUERY = sa.select(
+            event_transitions.c.author_id,
+            event_transitions.c.event,
+            event_transitions.c.created_at.label("start_datetime"),
+            sa.func.coalesce(event_transitions.c.next_created_at, sa.func.now()).label(
+                "end_datetime"
+            ),
+        ).select_from(event_transitions)
 
 
         class EventPeriod(BaseSQL):
             __tablename__ = "EventPeriods"
-            __table__ = view_table(__tablename__, BaseSQL.metadata, event_period_view_query())
+            __table__ = view_table(__tablename__, BaseSQL.metadata, EVENT_PERIOD_QUERY)
 
             author_id: Mapped[str]
             event: Mapped[str]
@@ -159,6 +179,10 @@ def view_table(name, metadata, selectable, *, cascade=True):
     t._columns._populate_separate_keys(
         col._make_proxy(t) for col in selectable.selected_columns
     )
+    if not sa.event.contains(metadata, "before_create", _forget_view_names):
+        # runs before the views of any run are checked, so every run reads the view names again
+        sa.event.listen(metadata, "before_create", _forget_view_names)
+        sa.event.listen(metadata, "before_drop", _forget_view_names, insert=True)
     sa.event.listen(
         metadata,
         "after_create",
@@ -189,6 +213,9 @@ class CreateView(DDLElement):
 
     """
 
+    # DDL is compiled when it runs, it's never cached
+    inherit_cache = False
+
     def __init__(self, name: str, selectable: sa.Select):
         self.name = name
         self.selectable = selectable
@@ -212,6 +239,8 @@ class DropView(DDLElement):
 
     """
 
+    inherit_cache = False
+
     def __init__(self, name, cascade=False, if_exists=False):
         self.name = name
         self.cascade = cascade
@@ -226,12 +255,43 @@ def _create_view(element: CreateView, compiler, **kw):
     )
 
 
-@compiler.compiles(DropView)
-def _drop_view(element: DropView, compiler, **kw):
+def _drop_view_sql(name: str, cascade: bool = False, if_exists: bool = False) -> str:
     text = "DROP VIEW "
-    if element.if_exists:
+    if if_exists:
         text += "IF EXISTS "
-    text += f'"{element.name}"'
-    if element.cascade:
+    text += f'"{name}"'
+    if cascade:
         text += " CASCADE"
     return text
+
+
+@compiler.compiles(DropView)
+def _drop_view(element: DropView, compiler, **kw):
+    return _drop_view_sql(element.name, element.cascade, element.if_exists)
+
+
+def drop_view(
+    connection: sa.Connection,
+    name: str,
+    *,
+    cascade: bool = False,
+    if_exists: bool = False,
+):
+    """Drop a view, sending the DROP VIEW statement straight to the driver.
+
+    Same as executing `DropView`, but the statement doesn't go through the DDL compiler.
+
+    Params:
+        connection: The connection to drop the view with.
+        name: The name of the view.
+        cascade: Whether to drop the view with cascade or not.
+        if_exists: Whether to drop the view if it exists or not.
+
+    Example:
+        ```python
+        def main():
+            drop_view(connection, ViewTable.__tablename__, if_exists=True)
+        ```
+
+    """
+    connection.exec_driver_sql(_drop_view_sql(name, cascade, if_exists))
@@ -0,0 +1,56 @@
+import pytest
+import pytest_asyncio
+import sqlalchemy as sa
+from sqlalchemy import StaticPool
+from sqlalchemy.dialects.sqlite.aiosqlite import SQLiteDialect_aiosqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+@pytest.fixture(scope="session", autouse=True)
+def statement_cache_supported():
+    # without it, every statement in the suite is compiled again on every execution
+    assert SQLiteDialect_aiosqlite.supports_statement_cache
+
+
+@pytest.fixture(scope="function")
+def record_statements():
+    """Call it with a sync engine to get the list of SQL statements it sends, in order."""
+    listeners = []
+
+    def record(engine: sa.Engine) -> list[str]:
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sa.event.listen(engine, "before_cursor_execute", _record)
+        listeners.append((engine, _record))
+        return statements
+
+    yield record
+    for engine, listener in listeners:
+        sa.event.remove(engine, "before_cursor_execute", listener)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # the database lives in memory, so there is nothing to keep durable
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def sqlite_engine():
+    # one in memory database per test module, each module creates its own schema in it
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        poolclass=StaticPool,
+        # inserts with RETURNING are sent in pages of this many rows
+        insertmanyvalues_page_size=10_000,
+    )
+    sa.event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    yield engine
+    await engine.dispose()
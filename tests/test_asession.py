@@ -0,0 +1,221 @@
+import pytest
+import pytest_asyncio
+import sqlalchemy as sa
+from sqlalchemy.engine.default import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
+
+from naked_sqla.exception import InvalidStatement, ParametersMismatch
+from naked_sqla.om.asession import AsyncSession, AsyncSessionFactory
+
+
+class BaseSQL(MappedAsDataclass, DeclarativeBase): ...
+
+
+class Item(BaseSQL):
+    __tablename__ = "Items"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(sa.String())
+
+
+@pytest_asyncio.fixture(scope="module")
+async def init_db(sqlite_engine: AsyncEngine):
+    # one database for the whole module, tests roll back what they change
+    db = AsyncSessionFactory(sqlite_engine)
+
+    async with sqlite_engine.begin() as conn:
+        await conn.run_sync(BaseSQL.metadata.create_all)
+
+    async with db.begin() as session:
+        await session.execute(
+            sa.insert(Item), [{"id": i, "name": str(i)} for i in range(1, 5)]
+        )
+
+    return db
+
+
+@pytest_asyncio.fixture(scope="function")
+async def session(init_db: AsyncSessionFactory):
+    async with init_db.begin() as session:
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_stream_scalars(session: AsyncSession):
+    query = sa.select(Item).order_by(Item.id)
+    result = await session.stream_scalars(query, execution_options={"yield_per": 2})
+    partitions = [
+        [obj.name for obj in partition] async for partition in result.partitions()
+    ]
+    assert partitions == [["1", "2"], ["3", "4"]]
+
+
+@pytest.mark.asyncio
+async def test_stream_dml_returning(session: AsyncSession):
+    query = sa.update(Item).where(Item.id <= 2).values(name="updated").returning(Item)
+    result = await session.stream_scalars(query)
+    assert [obj.name async for obj in result] == ["updated", "updated"]
+    await session.rollback()  # to not affect other tests
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_invalid_statements(session: AsyncSession):
+    # classified by the same dispatch table as execute()
+    with pytest.raises(InvalidStatement):
+        await session.stream("SELECT 1")  # type: ignore
+    with pytest.raises(InvalidStatement):
+        await session.execute("SELECT 1")  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_stream_scalars_yield_per_on_the_statement(session: AsyncSession):
+    query = sa.select(Item).order_by(Item.id).execution_options(yield_per=1)
+    result = await session.stream_scalars(query)
+    partitions = [
+        [obj.name for obj in partition] async for partition in result.partitions()
+    ]
+    assert partitions == [["1"], ["2"], ["3"], ["4"]]
+
+    # the memoized context of the same statement without yield_per isn't affected
+    result = await session.stream_scalars(sa.select(Item).order_by(Item.id))
+    partitions = [
+        [obj.name for obj in partition] async for partition in result.partitions()
+    ]
+    assert partitions == [["1", "2", "3", "4"]]
+
+
+@pytest.mark.asyncio
+async def test_execute_many(session: AsyncSession):
+    results = await session.execute_many(
+        [
+            sa.insert(Item),
+            sa.update(Item).where(Item.id > 4).values(name="updated"),
+            sa.select(Item).where(Item.id > 4),
+        ],
+        [[{"id": 5, "name": "5"}, {"id": 6, "name": "6"}], None, None],
+    )
+    assert len(results) == 3
+    assert [obj.name for obj in results[2].scalars()] == ["updated", "updated"]
+    await session.rollback()  # to not affect other tests
+
+
+@pytest.mark.asyncio
+async def test_execute_many_parameters_mismatch(session: AsyncSession):
+    with pytest.raises(ParametersMismatch):
+        await session.execute_many([sa.select(Item), sa.select(Item)], [None])
+
+
+@pytest.mark.asyncio
+async def test_execute_many_stops_at_the_failing_statement(
+    sqlite_engine: AsyncEngine, session: AsyncSession, record_statements
+):
+    statements = record_statements(sqlite_engine.sync_engine)
+    with pytest.raises(sa.exc.IntegrityError) as excinfo:
+        await session.execute_many(
+            [sa.update(Item).values(name="updated"), sa.insert(Item), sa.delete(Item)],
+            [None, [{"id": 1, "name": "1"}], None],
+        )
+    await session.rollback()  # to not affect other tests
+    assert [statement.split()[0] for statement in statements] == ["UPDATE", "INSERT"]
+    assert excinfo.value.statement == statements[1]
+
+
+@pytest.mark.asyncio
+async def test_begin_closes_session(init_db: AsyncSessionFactory):
+    async with init_db.begin() as session:
+        assert session.state == "open"
+    assert session.state == "closed"
+
+    async with init_db.begin() as session:
+        await session.rollback()  # already closed, so it's not committed again
+    assert session.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_sessions_have_no_instance_dict(init_db: AsyncSessionFactory):
+    with pytest.raises(AttributeError):
+        init_db.undeclared = True  # type: ignore
+    async with init_db.begin() as session:
+        with pytest.raises(AttributeError):
+            session.undeclared = True  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_prewarm(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'prewarm.db'}",
+        poolclass=sa.AsyncAdaptedQueuePool,
+    )
+    await AsyncSessionFactory(engine).prewarm(3)
+    assert engine.sync_engine.pool.checkedin() == 3  # type: ignore
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query_cache_size, cache_stats",
+    [
+        (500, [CacheStats.CACHE_MISS, CacheStats.CACHE_HIT]),
+        (0, [CacheStats.CACHING_DISABLED, CacheStats.CACHING_DISABLED]),
+    ],
+)
+async def test_engine_query_cache_size_is_respected(query_cache_size, cache_stats):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=sa.StaticPool,
+        query_cache_size=query_cache_size,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseSQL.metadata.create_all)
+
+    seen = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(context.cache_hit)
+
+    sa.event.listen(engine.sync_engine, "after_cursor_execute", _record)
+    try:
+        async with AsyncSessionFactory(engine).begin() as session:
+            for _ in range(2):
+                await session.scalars(sa.select(Item))
+    finally:
+        await engine.dispose()
+    assert seen == cache_stats
+
+
+@pytest.mark.asyncio
+async def test_autocommit_isolation_level_is_detected():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:").execution_options(
+        isolation_level="AUTOCOMMIT"
+    )
+    try:
+        async with AsyncSessionFactory(engine).begin() as session:
+            assert session._autocommit
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_autocommit_isolation_level_on_create_engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        isolation_level="AUTOCOMMIT",
+        poolclass=sa.StaticPool,
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(BaseSQL.metadata.create_all)
+        # not seen by the session, so it commits and sqlalchemy skips the commit itself
+        async with AsyncSessionFactory(engine).begin() as session:
+            await session.execute(sa.insert(Item), [{"id": 1, "name": "1"}])
+        assert session.state == "closed"
+        async with engine.connect() as conn:
+            assert (await conn.scalars(sa.select(Item.name))).all() == ["1"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_default_isolation_level_is_not_autocommit(init_db: AsyncSessionFactory):
+    async with init_db.begin() as session:
+        assert not session._autocommit
@@ -9,15 +9,15 @@
 
 
 from contextlib import asynccontextmanager
-from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from typing import Union
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
+import pytest_asyncio
 import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession as SmartAsyncSession
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
 
 from naked_sqla.om.asession import AsyncSession, AsyncSessionFactory
@@ -30,30 +30,66 @@ class Event(BaseSQL):
     __tablename__ = "Events"
     event: Mapped[str] = mapped_column(sa.String())
     created_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True))
-    id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
+    # uuids stored as their 16 raw bytes, not as 36 character strings
+    id: Mapped[bytes] = mapped_column(
+        sa.LargeBinary(16), primary_key=True, default_factory=lambda: uuid4().bytes
     )
-    author_id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
+    author_id: Mapped[bytes] = mapped_column(
+        sa.LargeBinary(16), primary_key=True, default_factory=lambda: uuid4().bytes
     )
 
 
-@asynccontextmanager
-async def init_naked_db():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    db = AsyncSessionFactory(engine)
-    async with engine.begin() as conn:
+# fixed values, every test starts from an empty table
+_AUTHOR_ID = UUID(int=0).bytes
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+# built once, so every run reuses the same statement and its cached compiled form
+_EVENT_LEAD = sa.select(
+    Event.id,
+    sa.func.lead(Event.event)
+    .over(
+        partition_by=Event.author_id,
+        order_by=Event.created_at,
+    )
+    .label("next_event"),
+).cte("event_lead")
+_EVENT_QUERY = (
+    sa.select(_EVENT_LEAD.c.id)
+    .select_from(_EVENT_LEAD)
+    .where(_EVENT_LEAD.c.next_event == "2")
+)
+_UPDATE_STMT = (
+    sa.update(Event)
+    .where(Event.id.in_(_EVENT_QUERY))
+    .values(event="2")
+    .returning(Event)
+)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def engine(sqlite_engine: AsyncEngine):
+    # the schema is created only once for the whole module
+    async with sqlite_engine.begin() as conn:
         await conn.run_sync(BaseSQL.metadata.create_all)
-    yield db
+    return sqlite_engine
 
 
-@asynccontextmanager
-async def init_sqlachemy_db():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    db = async_sessionmaker(engine, expire_on_commit=False, autobegin=False)
+@pytest_asyncio.fixture(scope="function")
+async def clean_engine(engine: AsyncEngine):
+    yield engine
     async with engine.begin() as conn:
-        await conn.run_sync(BaseSQL.metadata.create_all)
-    yield db
+        await conn.execute(sa.delete(Event))
+
+
+@asynccontextmanager
+async def init_naked_db(engine: AsyncEngine):
+    yield AsyncSessionFactory(engine)
+
+
+@asynccontextmanager
+async def init_sqlachemy_db(engine: AsyncEngine):
+    yield async_sessionmaker(engine, expire_on_commit=False, autobegin=False)
 
 
 async def complicated_update_scenario(session: Union[AsyncSession, SmartAsyncSession]):
@@ -61,58 +97,53 @@ async def complicated_update_scenario(session: Union[AsyncSession, SmartAsyncSes
     A scenario where we need to update a row based on the next row's value.
     The updated row is the one that has the event value of "2".
     """
-    now = datetime.now(timezone.utc)
-    author_id = str(uuid4())
+    author_id = _AUTHOR_ID
     objs = [
-        Event(author_id=author_id, event="1", created_at=now - timedelta(days=4)),
-        Event(author_id=author_id, event="2", created_at=now - timedelta(days=3)),
+        Event(author_id=author_id, event="1", created_at=_NOW - timedelta(days=4)),
+        Event(author_id=author_id, event="2", created_at=_NOW - timedelta(days=3)),
     ]
 
+    # a single multi VALUES insert, instead of executemany
     inserted_objs = (
         await session.execute(
-            sa.insert(Event).returning(Event), [asdict(obj) for obj in objs]
+            sa.insert(Event)
+            .values(
+                [
+                    {
+                        "id": obj.id,
+                        "author_id": obj.author_id,
+                        "event": obj.event,
+                        "created_at": obj.created_at,
+                    }
+                    for obj in objs
+                ]
+            )
+            .returning(Event)
         )
     ).all()
     print(inserted_objs)
 
-    event_lead = sa.select(
-        Event.id,
-        sa.func.lead(Event.event)
-        .over(
-            partition_by=Event.author_id,
-            order_by=Event.created_at,
-        )
-        .label("next_event"),
-    ).subquery()
-    event_query = (
-        sa.select(event_lead.c.id)
-        .select_from(event_lead)
-        .where(event_lead.c.next_event == "2")
-    )
-
-    query = (
-        sa.update(Event)
-        .where(Event.id.in_(event_query))
-        .values(event="2")
-        .returning(Event)
-    )
-
-    result = (await session.execute(query)).scalars().first()
-    assert result is not None
-    return result
+    # exactly one row is updated. RETURNING keeps the whole Event,
+    # since the mapping of that object is what this scenario checks.
+    # streamed, so the returned rows are not buffered before they are mapped.
+    return await (await session.stream_scalars(_UPDATE_STMT)).one()
 
 
 @pytest.mark.asyncio
-async def test_complicated_update_map_correctly_in_naked_sqla():
-    async with init_naked_db() as db:
+async def test_complicated_update_map_correctly_in_naked_sqla(
+    clean_engine: AsyncEngine,
+):
+    async with init_naked_db(clean_engine) as db:
         async with db.begin() as session:
             result = await complicated_update_scenario(session)
             assert result.event == "2"
 
 
 @pytest.mark.asyncio
-async def test_complicated_update_map_incorrectly_in_sqlalchemy():
-    async with init_sqlachemy_db() as db:
+async def test_complicated_update_map_incorrectly_in_sqlalchemy(
+    clean_engine: AsyncEngine,
+):
+    async with init_sqlachemy_db(clean_engine) as db:
         async with db.begin() as session:
             result = await complicated_update_scenario(session)
             assert result.event == "1"
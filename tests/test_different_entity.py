@@ -1,13 +1,12 @@
-from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
+from typing import Any, Union
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
 import sqlalchemy as sa
-from rich import print
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import (
     Bundle,
     DeclarativeBase,
@@ -26,11 +25,12 @@ class E1(BaseSQL):
     __tablename__ = "E1"
     event: Mapped[str] = mapped_column(sa.String())
     created_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True))
-    id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
+    # uuids stored as their 16 raw bytes, not as 36 character strings
+    id: Mapped[bytes] = mapped_column(
+        sa.LargeBinary(16), primary_key=True, default_factory=lambda: uuid4().bytes
     )
-    author_id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
+    author_id: Mapped[bytes] = mapped_column(
+        sa.LargeBinary(16), primary_key=True, default_factory=lambda: uuid4().bytes
     )
 
     __table_args__ = (
@@ -47,44 +47,65 @@ class E2(BaseSQL):
     __tablename__ = "E2"
     event: Mapped[str] = mapped_column(sa.String())
     created_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True))
-    id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
+    id: Mapped[bytes] = mapped_column(
+        sa.LargeBinary(16), primary_key=True, default_factory=lambda: uuid4().bytes
     )
-    author_id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
+    author_id: Mapped[bytes] = mapped_column(
+        sa.LargeBinary(16), primary_key=True, default_factory=lambda: uuid4().bytes
     )
 
 
+# fixed values, the tests don't need them to be unique across runs
+_AUTHORS = [UUID(int=i).bytes for i in range(8)]
+_IDS = [UUID(int=i).bytes for i in range(2)]
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _as_row(obj: Union[E1, E2]) -> dict[str, Any]:
+    # plain attribute access, asdict() would deep copy every field
+    return {
+        "id": obj.id,
+        "author_id": obj.author_id,
+        "event": obj.event,
+        "created_at": obj.created_at,
+    }
+
+
+# built once, so the labels keep their identity and the query its cached compiled form
+_EVENT_BUNDLE = Bundle(
+    "event_bundle", E1.event.label("e1_event"), E2.event.label("e2_event")
+)
+_BUNDLE_QUERY = sa.select(_EVENT_BUNDLE).join(E2, E1.author_id == E2.author_id)
+
+
 @pytest_asyncio.fixture(scope="module")
-async def init_db():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    db = AsyncSessionFactory(engine)
+async def init_db(sqlite_engine: AsyncEngine):
+    # one database for the whole module, tests roll back what they change
+    db = AsyncSessionFactory(sqlite_engine)
 
-    async with engine.begin() as conn:
+    async with sqlite_engine.begin() as conn:
         await conn.run_sync(BaseSQL.metadata.create_all)
 
-    now = datetime.now(timezone.utc)
-    author1 = str(uuid4())
-    author2 = str(uuid4())
-    author3 = str(uuid4())
-    author4 = str(uuid4())
+    author1, author2, author3, author4 = _AUTHORS[:4]
     objs = [
-        E1(author_id=author1, event="1", created_at=now - timedelta(days=4)),
-        E1(author_id=author2, event="2", created_at=now - timedelta(days=3)),
-        E1(author_id=author3, event="3", created_at=now - timedelta(days=2)),
-        E1(author_id=author4, event="4", created_at=now - timedelta(days=1)),
+        E1(author_id=author1, event="1", created_at=_NOW - timedelta(days=4)),
+        E1(author_id=author2, event="2", created_at=_NOW - timedelta(days=3)),
+        E1(author_id=author3, event="3", created_at=_NOW - timedelta(days=2)),
+        E1(author_id=author4, event="4", created_at=_NOW - timedelta(days=1)),
     ]
     parents = [
-        E2(author_id=author1, event="1", created_at=now - timedelta(days=4)),
-        E2(author_id=author2, event="2", created_at=now - timedelta(days=3)),
-        E2(author_id=author3, event="3", created_at=now - timedelta(days=2)),
-        E2(author_id=author4, event="4", created_at=now - timedelta(days=1)),
+        E2(author_id=author1, event="1", created_at=_NOW - timedelta(days=4)),
+        E2(author_id=author2, event="2", created_at=_NOW - timedelta(days=3)),
+        E2(author_id=author3, event="3", created_at=_NOW - timedelta(days=2)),
+        E2(author_id=author4, event="4", created_at=_NOW - timedelta(days=1)),
     ]
+    # one after the other on purpose: the in memory database has a single connection,
+    # so there is no second connection to gather on, and a session must never be gathered.
     async with db.begin() as session:
-        await session.execute(sa.insert(E1).values([asdict(obj) for obj in objs]))
-        await session.execute(sa.insert(E2).values([asdict(obj) for obj in parents]))
+        await session.execute(sa.insert(E1).values([_as_row(obj) for obj in objs]))
+        await session.execute(sa.insert(E2).values([_as_row(obj) for obj in parents]))
 
-    yield db
+    return db
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -94,35 +115,23 @@ async def session(init_db: AsyncSessionFactory):
 
 
 @pytest.mark.asyncio
-async def test_multi_select(session: AsyncSession):
-    query = (
-        sa.select(E1, E2)
-        .join(E2, E1.author_id == E2.author_id)
-        .where(E1.author_id == E2.author_id)
-        .order_by(E1.event)
-    )
-    result = (await session.tuples(query)).all()
-    print(result)  # updated object
+async def test_join_selects(session: AsyncSession):
+    # the same join selected three ways, in one session instead of one per way
+
+    # entities
+    query = sa.select(E1, E2).join(E2, E1.author_id == E2.author_id)
+    # sorted here, so sqlite doesn't have to sort the joined rows
+    result = sorted((await session.tuples(query)).all(), key=lambda row: row[0].event)
     assert len(result) == 4
     assert result[0][0].event == "1"
     assert result[1][0].event == "2"
     assert result[2][0].event == "3"
     assert result[3][0].event == "4"
 
-
-@pytest.mark.asyncio
-async def test_bundle_select(session: AsyncSession):
-    event_bundle = Bundle(
-        "event_bundle", E1.event.label("e1_event"), E2.event.label("e2_event")
-    )
-
-    query = (
-        sa.select(event_bundle)
-        .join(E2, E1.author_id == E2.author_id)
-        .order_by(E1.event)
+    # bundle
+    result = sorted(
+        (await session.execute(_BUNDLE_QUERY)).all(), key=lambda row: row[0].e1_event
     )
-    result = (await session.execute(query)).all()
-    print(result)
     assert len(result) == 4
     # Accessing bundle elements
     for row in result:
@@ -136,16 +145,9 @@ async def test_bundle_select(session: AsyncSession):
     assert result[2][0].e1_event == "3"
     assert result[3][0].e1_event == "4"
 
-
-@pytest.mark.asyncio
-async def test_with_column_select(session: AsyncSession):
-    query = (
-        sa.select(E1.event, E2.event)
-        .join(E2, E1.author_id == E2.author_id)
-        .order_by(E1.event)
-    )
-    result = (await session.execute(query)).all()
-    print(result)
+    # columns
+    query = sa.select(E1.event, E2.event).join(E2, E1.author_id == E2.author_id)
+    result = sorted((await session.execute(query)).all(), key=lambda row: row[0])
     assert len(result) == 4
     assert result[0][0] == "1"
     assert result[0][1] == "1"
@@ -159,23 +161,22 @@ async def test_with_column_select(session: AsyncSession):
 
 @pytest.mark.asyncio
 async def test_with_pg_insert(session: AsyncSession):
-    author5 = str(uuid4())
-    author6 = str(uuid4())
+    author5, author6 = _AUTHORS[4:6]
     pg_insert_stmt = (
         pg_insert(E1)
         .values(
             [
                 {
-                    "id": str(uuid4()),
+                    "id": _IDS[0],
                     "author_id": author5,
                     "event": "5",
-                    "created_at": datetime.now(timezone.utc),
+                    "created_at": _NOW,
                 },
                 {
-                    "id": str(uuid4()),
+                    "id": _IDS[1],
                     "author_id": author6,
                     "event": "6",
-                    "created_at": datetime.now(timezone.utc),
+                    "created_at": _NOW,
                 },
             ]
         )
@@ -183,10 +184,38 @@ async def test_with_pg_insert(session: AsyncSession):
     )
 
     result = (await session.execute(pg_insert_stmt)).all()
-    print(result)
     assert len(result) == 2
     assert result[0].event == "5"
     assert result[1].event == "6"
     assert result[0].author_id == author5
     assert result[1].author_id == author6
     await session.rollback()  # to not affect other tests
+
+
+@pytest.mark.asyncio
+async def test_scalars_multi_select(session: AsyncSession):
+    query = sa.select(E1, E2).join(E2, E1.author_id == E2.author_id).order_by(E1.event)
+    result = (await session.scalars(query)).all()
+    assert [type(obj) for obj in result] == [E1, E1, E1, E1]
+    assert [obj.event for obj in result] == ["1", "2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_no_reload_after_commit(init_db: AsyncSessionFactory):
+    # objects are plain, there is nothing to expire on commit and nothing to reload
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = init_db.engine.sync_engine
+    async with init_db.begin() as session:
+        result = (await session.scalars(sa.select(E1).order_by(E1.event))).all()
+
+    sa.event.listen(sync_engine, "before_cursor_execute", _record)
+    try:
+        assert [obj.event for obj in result] == ["1", "2", "3", "4"]
+        assert [obj.author_id for obj in result] == _AUTHORS[:4]
+    finally:
+        sa.event.remove(sync_engine, "before_cursor_execute", _record)
+    assert statements == []
@@ -0,0 +1,200 @@
+import gc
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
+
+from naked_sqla.exception import ParametersMismatch
+from naked_sqla.om.context import QueryContext
+from naked_sqla.om.session import Session, SessionFactory
+
+
+class BaseSQL(MappedAsDataclass, DeclarativeBase): ...
+
+
+class Item(BaseSQL):
+    __tablename__ = "Items"
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(sa.String())
+
+
+class _AlwaysTrue(sa.ColumnElement[bool]):
+    # no cache key, so a statement using it is compiled again on every execution
+    inherit_cache = False
+    type = sa.Boolean()
+
+
+@compiles(_AlwaysTrue)
+def _compile_always_true(element, compiler, **kw):
+    return "1 = 1"
+
+
+def _create_engine(**kw) -> sa.Engine:
+    engine = sa.create_engine("sqlite://", poolclass=sa.StaticPool, **kw)
+    BaseSQL.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(scope="function")
+def engine():
+    engine = _create_engine()
+    with engine.begin() as conn:
+        conn.execute(sa.insert(Item), [{"id": i, "name": str(i)} for i in range(1, 5)])
+    yield engine
+    engine.dispose()
+
+
+def _names(engine: sa.Engine) -> list[str]:
+    with engine.connect() as conn:
+        return list(conn.scalars(sa.select(Item.name).order_by(Item.id)))
+
+
+def _live_query_contexts() -> int:
+    gc.collect()
+    return sum(isinstance(obj, QueryContext) for obj in gc.get_objects())
+
+
+def test_query_contexts_are_dropped_with_the_compiled_cache():
+    engine = _create_engine(query_cache_size=10)
+    before = _live_query_contexts()
+    with SessionFactory(engine).begin() as session:
+        for i in range(200):
+            # a different statement every time, so the compiled cache keeps evicting
+            query = sa.select(Item).where(Item.name == sa.literal_column(f"'{i}'"))
+            session.scalars(query).all()
+    # the memoized contexts only live as long as their compiled cache entry
+    assert _live_query_contexts() - before <= 20
+    engine.dispose()
+
+
+def test_query_contexts_of_uncached_statements_are_dropped():
+    engine = _create_engine()
+    before = _live_query_contexts()
+    query = sa.select(Item).where(_AlwaysTrue())
+    with SessionFactory(engine).begin() as session:
+        for _ in range(200):
+            session.scalars(query).all()
+    assert _live_query_contexts() - before <= 1
+    engine.dispose()
+
+
+def test_query_contexts_of_dml_returning_are_dropped():
+    engine = _create_engine()
+    before = _live_query_contexts()
+    query = sa.update(Item).where(_AlwaysTrue()).values(name="updated").returning(Item)
+    with SessionFactory(engine).begin() as session:
+        session.execute(sa.insert(Item), [{"id": 1, "name": "1"}])
+        for _ in range(200):
+            assert [item.name for item in session.scalars(query)] == ["updated"]
+    assert _live_query_contexts() - before <= 1
+    engine.dispose()
+
+
+def test_prewarm_fills_the_pool(tmp_path):
+    engine = sa.create_engine(
+        f"sqlite:///{tmp_path / 'prewarm.db'}", poolclass=sa.QueuePool, pool_size=3
+    )
+    SessionFactory(engine).prewarm()
+    assert engine.pool.checkedin() == 3  # type: ignore
+    engine.dispose()
+
+
+def test_prewarm_pool_without_size():
+    # SingletonThreadPool, where `size` is not a method
+    engine = sa.create_engine("sqlite://")
+    SessionFactory(engine).prewarm()
+    engine.dispose()
+
+
+def test_begin_commits_on_exit(engine: sa.Engine):
+    with SessionFactory(engine).begin() as session:
+        session.execute(sa.insert(Item), [{"id": 5, "name": "5"}])
+    assert session.state == "closed"
+    assert _names(engine) == ["1", "2", "3", "4", "5"]
+
+
+def test_begin_rolls_back_without_auto_commit(engine: sa.Engine):
+    with SessionFactory(engine, auto_commit=False).begin() as session:
+        session.execute(sa.insert(Item), [{"id": 5, "name": "5"}])
+    assert session.state == "closed"
+    assert _names(engine) == ["1", "2", "3", "4"]
+
+
+def test_begin_rolls_back_on_error(engine: sa.Engine):
+    with pytest.raises(ValueError):
+        with SessionFactory(engine).begin() as session:
+            session.execute(sa.insert(Item), [{"id": 5, "name": "5"}])
+            raise ValueError("failed")
+    assert _names(engine) == ["1", "2", "3", "4"]
+
+
+def test_begin_hands_a_failing_commit_to_the_transaction(
+    engine: sa.Engine, monkeypatch: pytest.MonkeyPatch
+):
+    def commit(self):
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(Session, "commit", commit)
+    # keep the context alive, so only its own __exit__ can close the transaction
+    context = SessionFactory(engine).begin()
+    with pytest.raises(RuntimeError, match="commit failed"):
+        with context as session:
+            session.execute(sa.insert(Item), [{"id": 5, "name": "5"}])
+    # the transaction was rolled back and its connection returned to the pool
+    assert session.conn.closed
+    assert _names(engine) == ["1", "2", "3", "4"]
+
+
+def test_scalars_returns_the_first_entity(engine: sa.Engine):
+    with SessionFactory(engine).begin() as session:
+        result = session.scalars(sa.select(Item, Item.name).order_by(Item.id)).all()
+    assert [type(obj) for obj in result] == [Item, Item, Item, Item]
+    assert [obj.name for obj in result] == ["1", "2", "3", "4"]
+
+
+def test_execute_many(engine: sa.Engine):
+    with SessionFactory(engine, auto_commit=False).begin() as session:
+        results = session.execute_many(
+            [
+                sa.insert(Item),
+                sa.update(Item).where(Item.id > 4).values(name="updated"),
+                sa.select(Item).where(Item.id > 4),
+            ],
+            [[{"id": 5, "name": "5"}, {"id": 6, "name": "6"}], None, None],
+        )
+        assert len(results) == 3
+        assert [obj.name for obj in results[2].scalars()] == ["updated", "updated"]
+
+
+def test_execute_many_parameters_mismatch(engine: sa.Engine):
+    with SessionFactory(engine).begin() as session:
+        with pytest.raises(ParametersMismatch):
+            session.execute_many([sa.select(Item), sa.select(Item)], [None])
+
+
+def test_execute_many_stops_at_the_failing_statement(
+    engine: sa.Engine, record_statements
+):
+    statements = record_statements(engine)
+    with SessionFactory(engine, auto_commit=False).begin() as session:
+        with pytest.raises(sa.exc.IntegrityError) as excinfo:
+            session.execute_many(
+                [
+                    sa.update(Item).values(name="updated"),
+                    sa.insert(Item),
+                    sa.delete(Item),
+                ],
+                [None, [{"id": 1, "name": "1"}], None],
+            )
+    assert [statement.split()[0] for statement in statements] == ["UPDATE", "INSERT"]
+    assert excinfo.value.statement == statements[1]
+
+
+def test_sessions_have_no_instance_dict(engine: sa.Engine):
+    factory = SessionFactory(engine)
+    with pytest.raises(AttributeError):
+        factory.undeclared = True  # type: ignore
+    with factory.begin() as session:
+        with pytest.raises(AttributeError):
+            session.undeclared = True  # type: ignore
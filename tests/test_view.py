@@ -0,0 +1,93 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+
+from naked_sqla.view import CreateView, drop_view, view_table
+
+metadata = sa.MetaData()
+events = sa.Table(
+    "Events",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("event", sa.String),
+)
+
+view_metadata = sa.MetaData()
+view_events = sa.Table(
+    "Events",
+    view_metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("event", sa.String),
+)
+view_table(
+    "first_events",
+    view_metadata,
+    sa.select(view_events).where(view_events.c.event == "1"),
+    cascade=False,  # sqlite has no DROP VIEW ... CASCADE
+)
+view_table(
+    "second_events",
+    view_metadata,
+    sa.select(view_events).where(view_events.c.event == "2"),
+    cascade=False,  # sqlite has no DROP VIEW ... CASCADE
+)
+
+
+def test_create_view_renders_the_current_selectable():
+    create = CreateView("first_events", sa.select(events).where(events.c.event == "1"))
+    assert str(create.compile(dialect=sqlite.dialect())).endswith("= '1'")
+
+    # the select is rendered every time, so replacing it changes the statement
+    create.selectable = sa.select(events).where(events.c.event == "2")
+    assert str(create.compile(dialect=sqlite.dialect())).endswith("= '2'")
+    assert str(create.compile(dialect=postgresql.dialect())).endswith("= '2'")
+
+
+@pytest.fixture(scope="function")
+def engine():
+    engine = sa.create_engine("sqlite://", poolclass=sa.StaticPool)
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_drop_view(engine: sa.Engine):
+    with engine.begin() as conn:
+        conn.execute(CreateView("all_events", sa.select(events)))
+        assert sa.inspect(conn).get_view_names() == ["all_events"]
+
+        drop_view(conn, "all_events")
+        assert sa.inspect(conn).get_view_names() == []
+
+
+def test_drop_view_if_exists(engine: sa.Engine):
+    with engine.begin() as conn:
+        drop_view(conn, "all_events", if_exists=True)
+        with pytest.raises(sa.exc.OperationalError):
+            drop_view(conn, "all_events")
+
+
+def test_view_names_are_read_once_per_run():
+    engine = sa.create_engine("sqlite://", poolclass=sa.StaticPool)
+    catalog_queries = []
+
+    def _record(conn, cursor, statement, *args):
+        if "type='view'" in statement:
+            catalog_queries.append(statement)
+
+    try:
+        with engine.connect() as conn:
+            # every run on the same connection sees the views left by the one before it
+            for run, view_names in [
+                (view_metadata.create_all, ["first_events", "second_events"]),
+                (view_metadata.drop_all, []),
+                (view_metadata.create_all, ["first_events", "second_events"]),
+            ]:
+                sa.event.listen(engine, "before_cursor_execute", _record)
+                run(conn)
+                sa.event.remove(engine, "before_cursor_execute", _record)
+                assert len(catalog_queries) == 1
+                catalog_queries.clear()
+                assert sa.inspect(conn).get_view_names() == view_names
+    finally:
+        engine.dispose()
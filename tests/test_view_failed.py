@@ -11,22 +11,24 @@
 
 # --------------------------------------
 
+import itertools
+import logging
 from contextlib import asynccontextmanager
-from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from typing import Union
-from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 import sqlalchemy as sa
-from rich import print
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 from sqlalchemy.ext.asyncio.session import AsyncSession as SmartAsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
 
 from naked_sqla.om.asession import AsyncSession, AsyncSessionFactory
 from naked_sqla.view import init_view_in_base, view_table
 
+logger = logging.getLogger(__name__)
+
 
 class BaseSQL(MappedAsDataclass, DeclarativeBase):
     def __init_subclass__(
@@ -38,19 +40,31 @@ class BaseSQL(MappedAsDataclass, DeclarativeBase):
         super().__init_subclass__(*args, **kw)
 
 
+# ids only need to be unique within a test run, a counter is enough
+_ids = itertools.count()
+
+
+def _next_id() -> str:
+    return f"{next(_ids):032x}"
+
+
+# the rows every test inserts, as (event, how long ago it happened)
+_ROW_TEMPLATES = (
+    ("1", timedelta(days=3)),
+    ("2", timedelta(days=2)),
+    ("3", timedelta(days=1)),
+)
+
+
 class Event(BaseSQL):
     __tablename__ = "Events"
     event: Mapped[str] = mapped_column(sa.String())
     created_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True))
-    id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
-    )
-    author_id: Mapped[str] = mapped_column(
-        primary_key=True, default_factory=lambda: str(uuid4())
-    )
+    id: Mapped[str] = mapped_column(primary_key=True, default_factory=_next_id)
+    author_id: Mapped[str] = mapped_column(primary_key=True, default_factory=_next_id)
 
 
-def event_period_view_query():
+def _build_event_period_query():
     event_transitions = sa.select(
         Event.author_id,
         Event.event,
@@ -67,7 +81,7 @@ def event_period_view_query():
             order_by=Event.created_at,
         )
         .label("next_created_at"),
-    ).subquery()
+    ).cte("event_transitions")
 
     event_periods = sa.select(
         event_transitions.c.author_id,
@@ -80,9 +94,20 @@ def event_period_view_query():
     return event_periods
 
 
-class EventPeriod(BaseSQL):
+# built once at import, the view and the statement selecting from it are reused by every test
+_EVENT_PERIOD_QUERY = _build_event_period_query()
+
+
+class BaseReadOnlySQL(DeclarativeBase):
+    # views are only read, never built by hand, so they skip the dataclass machinery.
+    # without it Mapped[] annotations work with __table__ as is, so init_view_in_base isn't needed.
+    # it shares the metadata, so create_all() creates the view after the tables.
+    metadata = BaseSQL.metadata
+
+
+class EventPeriod(BaseReadOnlySQL):
     __tablename__ = "EventPeriods"
-    __table__ = view_table(__tablename__, BaseSQL.metadata, event_period_view_query())
+    __table__ = view_table(__tablename__, BaseSQL.metadata, _EVENT_PERIOD_QUERY)
 
     # id: Mapped[str]
     author_id: Mapped[str]
@@ -91,56 +116,87 @@ class EventPeriod(BaseSQL):
     end_datetime: Mapped[datetime]
 
 
-@asynccontextmanager
-async def init_naked_db():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    db = AsyncSessionFactory(engine)
-    async with engine.begin() as conn:
+class KeyedEventPeriod(BaseReadOnlySQL):
+    # the same view, told which columns identify a row,
+    # so SQLAlchemy's identity map keys each period correctly.
+    __table__ = EventPeriod.__table__
+    __mapper_args__ = {
+        "primary_key": [
+            __table__.c.author_id,
+            __table__.c.event,
+            __table__.c.start_datetime,
+        ]
+    }
+
+    author_id: Mapped[str]
+    event: Mapped[str]
+    start_datetime: Mapped[datetime]
+    end_datetime: Mapped[datetime]
+
+
+_VIEW_QUERY = sa.select(EventPeriod).order_by(EventPeriod.event)
+_KEYED_VIEW_QUERY = sa.select(KeyedEventPeriod).order_by(KeyedEventPeriod.event)
+_STREAM_OPTIONS = {"yield_per": 64}
+_VIEW_EVENTS_QUERY = sa.select(EventPeriod.event).order_by(EventPeriod.event)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def engine(sqlite_engine: AsyncEngine):
+    # the tables and the view are created only once for the whole module
+    async with sqlite_engine.begin() as conn:
         await conn.run_sync(BaseSQL.metadata.create_all)
-    yield db
+    return sqlite_engine
 
 
-@asynccontextmanager
-async def init_sqlachemy_db():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    db = async_sessionmaker(engine, expire_on_commit=False, autobegin=False)
+@pytest_asyncio.fixture(scope="function")
+async def clean_engine(engine: AsyncEngine):
+    yield engine
     async with engine.begin() as conn:
-        await conn.run_sync(BaseSQL.metadata.create_all)
-    yield db
+        await conn.execute(sa.delete(Event))
+
+
+@asynccontextmanager
+async def init_naked_db(engine: AsyncEngine):
+    yield AsyncSessionFactory(engine)
+
+
+@asynccontextmanager
+async def init_sqlachemy_db(engine: AsyncEngine):
+    yield async_sessionmaker(engine, expire_on_commit=False, autobegin=False)
 
 
 async def run_view_query(session: Union[AsyncSession, SmartAsyncSession]):
     now = datetime.now(timezone.utc)
-    author_id = str(uuid4())
-    objs = [
-        Event(
-            author_id=author_id,
-            event="1",
-            created_at=now - timedelta(days=3),
-        ),
-        Event(
-            author_id=author_id,
-            event="2",
-            created_at=now - timedelta(days=2),
-        ),
-        Event(
-            author_id=author_id,
-            event="3",
-            created_at=now - timedelta(days=1),
-        ),
+    author_id = _next_id()
+    # plain rows, no Event objects, passed as executemany parameters
+    rows = [
+        {
+            "id": _next_id(),
+            "author_id": author_id,
+            "event": event,
+            "created_at": now - age,
+        }
+        for event, age in _ROW_TEMPLATES
     ]
-    await session.execute(sa.insert(Event).values([asdict(obj) for obj in objs]))
+    # both statements already run on the one connection of the session's transaction,
+    # a savepoint around them would only add SAVEPOINT and RELEASE round trips.
+    await session.execute(sa.insert(Event), rows)
 
-    query = sa.select(EventPeriod).order_by(EventPeriod.event)
-    result = (await session.execute(query)).scalars().all()
-    print(result)
+    # streamed in batches, so a larger view isn't buffered all at once
+    periods = await session.stream_scalars(
+        _VIEW_QUERY, execution_options=_STREAM_OPTIONS
+    )
+    result = [period async for period in periods]
+    logger.debug("view rows: %r", result)
     assert len(result) == 3
     return result
 
 
 @pytest.mark.asyncio
-async def test_naked_sqla_detect_view_identity_key_correctly():
-    async with init_naked_db() as db:
+async def test_naked_sqla_detect_view_identity_key_correctly(
+    clean_engine: AsyncEngine,
+):
+    async with init_naked_db(clean_engine) as db:
         async with db.begin() as session:
             result = await run_view_query(session)
             assert result[0].event == "1"
@@ -149,10 +205,43 @@ async def test_naked_sqla_detect_view_identity_key_correctly():
 
 
 @pytest.mark.asyncio
-async def test_sqlalchemy_fail_to_detect_view_identity_key():
-    async with init_sqlachemy_db() as db:
+async def test_sqlalchemy_fail_to_detect_view_identity_key(
+    clean_engine: AsyncEngine,
+):
+    async with init_sqlachemy_db(clean_engine) as db:
         async with db.begin() as session:
             result = await run_view_query(session)
             assert result[0].event == "1"
             assert result[1].event == "1"
             assert result[2].event == "1"
+
+            # core doesn't map rows to objects, so it gets every row right.
+            # only the event column is selected, and streamed one row at a time.
+            conn = await session.connection()
+            events = [
+                event
+                async for event in (await conn.stream(_VIEW_EVENTS_QUERY)).scalars()
+            ]
+            assert events == ["1", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_detect_view_identity_key_with_explicit_primary_key(
+    clean_engine: AsyncEngine,
+):
+    async with init_sqlachemy_db(clean_engine) as db:
+        async with db.begin() as session:
+            await run_view_query(session)
+            result = (await session.execute(_KEYED_VIEW_QUERY)).scalars().all()
+            assert [period.event for period in result] == ["1", "2", "3"]
+
+            # the second run finds every period in the identity map
+            again = (await session.execute(_KEYED_VIEW_QUERY)).scalars().all()
+            assert len(again) == len(result)
+            assert all(a is b for a, b in zip(result, again))
+
+
+def test_view_query_is_cacheable():
+    # a select from the view has a cache key, so it's compiled only once
+    assert _VIEW_QUERY._generate_cache_key() is not None
+    assert _VIEW_QUERY._generate_cache_key() == _VIEW_QUERY._generate_cache_key()